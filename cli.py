@@ -2,10 +2,10 @@
 """Command-line interface for AWS ML Cost Analysis Agent."""
 
 import argparse
+import functools
 import logging
 import os
 import sys
-import time
 from typing import Optional
 
 
@@ -56,16 +56,7 @@ def _setup_logging(debug: bool = False) -> None:
     )
 
 
-def _parse_arguments() -> argparse.Namespace:
-    """Parse command-line arguments.
-
-    Returns:
-        Parsed command-line arguments
-    """
-    parser = argparse.ArgumentParser(
-        description="Analyze AWS ML workload costs and provide optimization recommendations",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Example usage:
     # Using environment variables (recommended)
     export TAVILY_API_KEY=your_tavily_key
@@ -84,7 +75,33 @@ Example usage:
 
     # Use custom config file
     ml-cost-analysis --config custom-config.yaml --query "..."
-""",
+"""
+
+
+def _parse_arguments() -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Help stays cheap without shortcuts: the parser is cached by
+    _build_parser and the heavy agent imports live inside main(), so
+    --help prints the full option list without paying for boto3/langchain.
+
+    Returns:
+        Parsed command-line arguments
+    """
+    return _build_parser().parse_args()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Construct the full argument parser, cached across warm invocations.
+
+    When main() is called repeatedly in one process (tests, notebooks),
+    the 13 add_argument calls only run once.
+    """
+    parser = argparse.ArgumentParser(
+        description="Analyze AWS ML workload costs and provide optimization recommendations",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     # Required arguments
@@ -175,7 +192,7 @@ Example usage:
         help="Root directory for filesystem backend (default: current directory)",
     )
 
-    return parser.parse_args()
+    return parser
 
 
 def main() -> None:
@@ -186,7 +203,8 @@ def main() -> None:
     _setup_logging(args.debug)
     logger = logging.getLogger(__name__)
 
-    # Validate query is provided
+    # Validate query is provided (and not just whitespace)
+    args.query = (args.query or "").strip()
     if not args.query:
         logger.error("Error: --query argument is required")
         sys.exit(1)
@@ -199,6 +217,8 @@ def main() -> None:
             "TAVILY_API_KEY",
             required=True,
         )
+        os.environ["TAVILY_API_KEY"] = tavily_key
+        # Keep the old misspelled name populated for back-compat
         os.environ["TAVILY_APY_KEY"] = tavily_key
 
         # AWS configuration (optional)
@@ -217,17 +237,19 @@ def main() -> None:
             os.environ["LANGCHAIN_PROJECT"] = args.langsmith_project
 
     except ValueError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         sys.exit(1)
 
-    # Now import the agent module (after environment setup)
+    # Now import the agent module (after environment setup). This import must
+    # stay inside main() so that --help and misconfiguration exits never pay
+    # the boto3/langchain import cost.
     try:
-        from long_running_deep_agent import (
+        from ml_cost_analysis.agent import (
             create_agent,
             run_deep_agent_query,
         )
     except ImportError as e:
-        logger.error(f"Failed to import agent module: {e}")
+        logger.error("Failed to import agent module: %s", e)
         logger.error("Make sure all dependencies are installed: uv sync")
         sys.exit(1)
 
@@ -255,12 +277,14 @@ def main() -> None:
         logger.info("Agent initialized successfully")
 
     except Exception as e:
-        logger.error(f"Failed to initialize agent: {e}")
+        logger.error("Failed to initialize agent: %s", e)
         sys.exit(1)
 
     # Run the query
     try:
-        logger.info(f"Running query: {args.query}")
+        import time
+
+        logger.info("Running query: %s", args.query)
         start_time = time.time()
 
         result = run_deep_agent_query(
@@ -274,29 +298,29 @@ def main() -> None:
         seconds = elapsed_time % 60
 
         if minutes > 0:
-            logger.info(f"Query completed in {minutes} minutes and {seconds:.1f} seconds")
+            logger.info("Query completed in %d minutes and %.1f seconds", minutes, seconds)
         else:
-            logger.info(f"Query completed in {seconds:.1f} seconds")
+            logger.info("Query completed in %.1f seconds", seconds)
 
-        # Output results
+        # Output results. Stream straight to stdout/file instead of building
+        # one large intermediate string -- agent results can be multi-MB.
         import json
 
-        output = json.dumps(result, indent=2, default=str)
-
         print("\n" + "="*80)
         print("AGENT RESPONSE")
         print("="*80)
-        print(output)
+        json.dump(result, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
         print("="*80)
 
         # Save to file if requested
         if args.output_file:
             with open(args.output_file, "w") as f:
-                f.write(output)
-            logger.info(f"Response saved to {args.output_file}")
+                json.dump(result, f, indent=2, default=str)
+            logger.info("Response saved to %s", args.output_file)
 
     except Exception as e:
-        logger.error(f"Query failed: {e}")
+        logger.error("Query failed: %s", e)
         if args.debug:
             logger.exception("Full traceback:")
         sys.exit(1)
@@ -7,12 +7,27 @@ costs in your AWS account and provides optimization recommendations.
 __version__ = "0.1.0"
 __author__ = "Your Name"
 
-from ml_cost_analysis.agent import (
-    create_agent,
-    run_deep_agent_query,
-)
-
 __all__ = [
     "create_agent",
     "run_deep_agent_query",
 ]
+
+
+def __getattr__(name):
+    """Lazily import the agent module on first attribute access (PEP 562).
+
+    Importing ml_cost_analysis stays cheap; the boto3/langchain/deepagents
+    import chain is only paid when create_agent or run_deep_agent_query is
+    actually touched.
+    """
+    if name in __all__:
+        from ml_cost_analysis.agent import create_agent, run_deep_agent_query
+
+        globals().update(
+            {
+                "create_agent": create_agent,
+                "run_deep_agent_query": run_deep_agent_query,
+            }
+        )
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
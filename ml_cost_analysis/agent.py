@@ -1,21 +1,24 @@
 import os
+import re
 import json
 import logging
-import boto3
-from botocore.config import Config
-from ml_cost_analysis.utils import *
-from ml_cost_analysis.constants import *
+import functools
+from ml_cost_analysis.utils import load_config, load_system_prompt
 from typing import Literal, Optional
-from dotenv import load_dotenv
 from tavily import TavilyClient
-from langsmith import traceable
-from langchain_aws import ChatBedrock
-from langchain_openai import ChatOpenAI
 from deepagents import create_deep_agent
 from deepagents.backends import StateBackend, FilesystemBackend
 
-# load the environment variables from the .env file
-load_dotenv()
+# .env loading is deferred into create_agent() so importing this module
+# never touches the filesystem; see _load_dotenv_once below
+_dotenv_loaded = False
+
+# The traced (or plain) query runner, resolved on first use. The
+# tracing-enabled check must run after _load_dotenv_once(), since
+# LANGSMITH_TRACING=true may come from the .env file; deciding at import
+# time would miss it. langsmith is only imported when tracing is on, so
+# the disabled path pays no per-call wrapper overhead.
+_query_runner = None
 
 # Import ML and monitoring tools
 from ml_cost_analysis.tools import (
@@ -40,6 +43,100 @@ from ml_cost_analysis.tools import (
 # set a logger
 logger = logging.getLogger(__name__)
 
+# Static AWS tool callables, built once so repeated agent builds don't
+# re-create the list (create_deep_agent introspects each tool's signature
+# and schema, so the constructed agent itself is also memoized below)
+_AWS_TOOLS = (
+    # ML-specific tools
+    list_sagemaker_training_jobs,
+    get_training_job_details,
+    list_sagemaker_endpoints,
+    get_endpoint_details,
+    analyze_bedrock_usage,
+    get_ml_cost_recommendations,
+    analyze_ml_data_storage,
+    # CloudWatch monitoring tools
+    list_cloudwatch_dashboards,
+    get_dashboard_summary,
+    list_log_groups,
+    fetch_cloudwatch_logs_for_service,
+    analyze_log_group,
+    get_cloudwatch_alarms_for_service,
+    setup_cross_account_access,
+)
+
+# Retryable errors: tool_use/tool_result mismatches and write_file
+# validation failures. Compiled once so the retry loop does a single
+# case-insensitive scan instead of three substring checks plus a
+# full-message .lower() allocation per exception. Lookaheads keep the
+# match order-independent: Bedrock phrases these messages both ways
+# (e.g. "Each `tool_result` block must have a corresponding `tool_use`
+# block ...").
+_RETRYABLE_ERROR_RE = re.compile(
+    r"(?=.*tool_use)(?=.*tool_result)|(?=.*validation error)(?=.*write_file)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_session_region() -> Optional[str]:
+    """Resolve the default region via a boto3 Session, once per process."""
+    import boto3
+
+    return boto3.session.Session().region_name
+
+
+def _get_region() -> Optional[str]:
+    """Get the AWS region, preferring env vars over a full Session lookup.
+
+    Instantiating a boto3 Session just to read the region triggers the
+    credential-provider chain and config-file parsing, so only fall back
+    to it when neither AWS_REGION nor AWS_DEFAULT_REGION is set.
+    """
+    return (
+        os.environ.get("AWS_REGION")
+        or os.environ.get("AWS_DEFAULT_REGION")
+        or _default_session_region()
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_bedrock_client(region_name: Optional[str], read_timeout: int):
+    """Build (or reuse) a bedrock-runtime client for the given region/timeout.
+
+    Client construction loads and parses the botocore service model, so the
+    client is memoized -- repeated create_agent() calls reuse the same
+    client and its connection pool.
+    """
+    import boto3
+    from botocore.config import Config
+
+    # Default timeout of 60s is insufficient for deep agents that may run
+    # 10-15+ minutes
+    bedrock_config = Config(
+        read_timeout=read_timeout,
+        connect_timeout=60,
+        retries={
+            'max_attempts': 3,
+            'mode': 'adaptive'
+        }
+    )
+    return boto3.client(
+        service_name='bedrock-runtime',
+        region_name=region_name,
+        config=bedrock_config
+    )
+
+
+def _load_dotenv_once() -> None:
+    """Load the .env file on first use instead of at module import."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+
 
 def create_agent(
     config_file: str = "config.yaml",
@@ -48,6 +145,11 @@ def create_agent(
 ):
     """Create and configure the deep research agent.
 
+    Repeated calls with the same configuration return the same agent
+    instance; the mtimes of both the config file and the system-prompt
+    file it points at are part of the cache key, so edits to either
+    invalidate it.
+
     Args:
         config_file: Path to configuration YAML file
         provider: LLM provider to use ('bedrock' or 'openai'). If None, uses config file setting
@@ -56,19 +158,78 @@ def create_agent(
     Returns:
         Configured deep agent instance
     """
+    # load the environment variables from the .env file (once per process)
+    _load_dotenv_once()
+
+    # Use provided root_dir or default to current directory (resolved here
+    # so the cache key is stable)
+    if root_dir is None:
+        root_dir = os.getcwd()
+
+    try:
+        config_mtime = os.path.getmtime(config_file)
+    except OSError:
+        config_mtime = 0.0
+
+    return _build_agent(
+        config_file,
+        config_mtime,
+        _prompt_mtime(config_file, provider),
+        provider,
+        root_dir,
+    )
+
+
+def _prompt_mtime(config_file: str, provider: Optional[str]) -> float:
+    """Stat the system-prompt file the config points at for the provider.
+
+    Returns 0.0 when the path cannot be resolved or the prompt is served
+    from the package resources (treated as immutable). load_config is
+    mtime-cached, so the extra read here is a dict lookup on repeat calls.
+    """
+    config_data = load_config(config_file)
+    try:
+        model_info = config_data["model_information"]["deep_agent_model_info"]
+        if provider is None:
+            provider = model_info.get("provider", "bedrock")
+        prompt_path = model_info[provider]["system_prompt_fpath"]
+        return os.path.getmtime(prompt_path)
+    except (TypeError, KeyError, OSError):
+        return 0.0
+
+
+@functools.lru_cache(maxsize=4)
+def _build_agent(
+    config_file: str,
+    config_mtime: float,
+    prompt_mtime: float,
+    provider: Optional[str],
+    root_dir: str,
+):
+    """Build the deep agent; memoized per (config, prompt, provider, root_dir).
+
+    Skips tool-schema introspection and model construction on repeat
+    builds with identical configuration. prompt_mtime is unused in the
+    body -- it is part of the key so that edits to the system-prompt
+    file rebuild the agent rather than returning one built with the old
+    prompt.
+    """
     # load the configuration file
     config_data = load_config(config_file)
-    logger.info(f"Loaded configuration from {config_file}")
+    logger.info("Loaded configuration from %s", config_file)
 
-    # initialize the Tavily client
-    tavily_api_key = os.getenv("TAVILY_APY_KEY")
+    # check the Tavily API key is present, but defer client construction
+    # until the first internet_search call -- many agent runs only hit the
+    # AWS tools and never need the HTTP client. TAVILY_APY_KEY is the old
+    # misspelled name, still accepted for back-compat.
+    tavily_api_key = os.getenv("TAVILY_API_KEY") or os.getenv("TAVILY_APY_KEY")
     if not tavily_api_key:
         raise ValueError(
-            "TAVILY_APY_KEY environment variable not set. "
+            "TAVILY_API_KEY environment variable not set. "
             "Please set it with: export TAVILY_API_KEY='your-api-key' or use --tavily-api-key"
         )
-    tavily_client = TavilyClient(api_key=tavily_api_key)
-    logger.info("Initialized Tavily client for internet search")
+
+    tavily_client = None
 
     def internet_search(
         query: str,
@@ -77,6 +238,10 @@ def create_agent(
         include_raw_content: bool = False,
     ):
         """Run a web search"""
+        nonlocal tavily_client
+        if tavily_client is None:
+            tavily_client = TavilyClient(api_key=tavily_api_key)
+            logger.info("Initialized Tavily client for internet search")
         return tavily_client.search(
             query,
             max_results=max_results,
@@ -87,14 +252,18 @@ def create_agent(
     # Get provider from config or parameter
     if provider is None:
         provider = config_data['model_information']["deep_agent_model_info"].get("provider", "bedrock")
-    logger.info(f"Using provider: {provider}")
+    logger.info("Using provider: %s", provider)
 
-    # Load provider-specific configuration
+    # Load provider-specific configuration. The provider SDKs are imported
+    # inside each branch so a Bedrock run never pays the OpenAI import tree
+    # and vice versa.
     if provider == "openai":
+        from langchain_openai import ChatOpenAI
+
         agent_config = config_data['model_information']["deep_agent_model_info"]["openai"]
         deep_agent_prompt_path = agent_config["system_prompt_fpath"]
         deep_agent_system_prompt = load_system_prompt(deep_agent_prompt_path)
-        logger.debug(f"Loaded system prompt from {deep_agent_prompt_path}")
+        logger.debug("Loaded system prompt from %s", deep_agent_prompt_path)
 
         # Get OpenAI API key from environment
         openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -113,31 +282,19 @@ def create_agent(
             openai_api_key=openai_api_key,
             request_timeout=12000,  # 200 minutes - accommodates long-running deep agent operations
         )
-        logger.info(f"Initialized OpenAI model: {agent_config['model_id']}")
+        logger.info("Initialized OpenAI model: %s", agent_config["model_id"])
 
     elif provider == "bedrock":
+        from langchain_aws import ChatBedrock
+
         agent_config = config_data['model_information']["deep_agent_model_info"]["bedrock"]
         deep_agent_prompt_path = agent_config["system_prompt_fpath"]
         deep_agent_system_prompt = load_system_prompt(deep_agent_prompt_path)
-        logger.debug(f"Loaded system prompt from {deep_agent_prompt_path}")
-
-        # Create a boto3 config with extended timeout for long-running deep agent queries
-        # Default timeout of 60s is insufficient for deep agents that may run 10-15+ minutes
-        bedrock_config = Config(
-            read_timeout=12000,  # 200 minutes - accommodates long-running deep agent operations
-            connect_timeout=60,
-            retries={
-                'max_attempts': 3,
-                'mode': 'adaptive'
-            }
-        )
+        logger.debug("Loaded system prompt from %s", deep_agent_prompt_path)
 
-        # Create a boto3 client with custom timeout configuration
-        bedrock_runtime_client = boto3.client(
-            service_name='bedrock-runtime',
-            region_name=boto3.session.Session().region_name,
-            config=bedrock_config
-        )
+        # Reuse a memoized client with extended timeout for long-running
+        # deep agent queries (200 minutes)
+        bedrock_runtime_client = _get_bedrock_client(_get_region(), 12000)
 
         deep_agent_model = ChatBedrock(
             client=bedrock_runtime_client,  # Use custom client with extended timeout
@@ -146,36 +303,13 @@ def create_agent(
             max_tokens=agent_config["inference_parameters"]["max_tokens"],
             top_p=agent_config["inference_parameters"]["top_p"],
         )
-        logger.info(f"Initialized Amazon Bedrock model: {agent_config['model_id']}")
+        logger.info("Initialized Amazon Bedrock model: %s", agent_config["model_id"])
 
     else:
         raise ValueError(f"Unsupported provider: {provider}. Must be 'openai' or 'bedrock'")
 
-    # Use provided root_dir or default to current directory
-    if root_dir is None:
-        root_dir = os.getcwd()
-
     deep_agent = create_deep_agent(
-        tools=[
-            # Internet search
-            internet_search,
-            # ML-specific tools
-            list_sagemaker_training_jobs,
-            get_training_job_details,
-            list_sagemaker_endpoints,
-            get_endpoint_details,
-            analyze_bedrock_usage,
-            get_ml_cost_recommendations,
-            analyze_ml_data_storage,
-            # CloudWatch monitoring tools
-            list_cloudwatch_dashboards,
-            get_dashboard_summary,
-            list_log_groups,
-            fetch_cloudwatch_logs_for_service,
-            analyze_log_group,
-            get_cloudwatch_alarms_for_service,
-            setup_cross_account_access,
-        ],
+        tools=[internet_search, *_AWS_TOOLS],
         model=deep_agent_model,
         system_prompt=deep_agent_system_prompt,
         backend=FilesystemBackend(root_dir=root_dir),
@@ -185,7 +319,6 @@ def create_agent(
     return deep_agent
 
 
-@traceable
 def run_deep_agent_query(
     agent,
     query: str,
@@ -193,6 +326,8 @@ def run_deep_agent_query(
 ) -> dict:
     """Run a query through the deep research agent with retry logic.
 
+    Traced via langsmith when LANGSMITH_TRACING=true (env or .env).
+
     Args:
         agent: The deep agent instance to use
         query: The user query to process
@@ -200,8 +335,33 @@ def run_deep_agent_query(
 
     Returns:
         The agent's response as a dictionary
+
+    Raises:
+        ValueError: If the query is empty or only whitespace
     """
-    logger.info(f"Running deep agent query: {query}")
+    global _query_runner
+    if _query_runner is None:
+        _load_dotenv_once()
+        if os.environ.get("LANGSMITH_TRACING", "").lower() == "true":
+            from langsmith import traceable
+
+            _query_runner = traceable(_run_deep_agent_query)
+        else:
+            _query_runner = _run_deep_agent_query
+    return _query_runner(agent, query, max_retries)
+
+
+def _run_deep_agent_query(
+    agent,
+    query: str,
+    max_retries: int = 3,
+) -> dict:
+    """Retry loop behind run_deep_agent_query; see its docstring."""
+    # Guard against empty queries before spending a full LLM round-trip
+    if not query or not query.strip():
+        raise ValueError("query must be non-empty")
+
+    logger.info("Running deep agent query: %s", query)
 
     for attempt in range(max_retries):
         try:
@@ -212,19 +372,18 @@ def run_deep_agent_query(
             error_msg = str(e)
 
             # Check if it's a retryable error (tool errors or validation errors)
-            is_retryable = (
-                "tool_use" in error_msg and "tool_result" in error_msg
-            ) or (
-                "validation error" in error_msg.lower() and "write_file" in error_msg
-            )
+            is_retryable = bool(_RETRYABLE_ERROR_RE.search(error_msg))
 
             if is_retryable:
                 logger.warning(
-                    f"Tool error on attempt {attempt + 1}/{max_retries}: {error_msg}"
+                    "Tool error on attempt %d/%d: %s",
+                    attempt + 1,
+                    max_retries,
+                    error_msg,
                 )
 
                 if attempt < max_retries - 1:
-                    logger.info(f"Retrying... (attempt {attempt + 2}/{max_retries})")
+                    logger.info("Retrying... (attempt %d/%d)", attempt + 2, max_retries)
                     continue
                 else:
                     logger.error(
@@ -3,26 +3,26 @@ Tools Package
 """
 
 # CloudWatch Monitoring Tools
-from .cloudwatch_tools import (
-    list_cloudwatch_dashboards,
-    get_dashboard_summary,
-    list_log_groups,
-    fetch_cloudwatch_logs_for_service,
-    analyze_log_group,
-    get_cloudwatch_alarms_for_service,
-    setup_cross_account_access,
-)
+_CW_NAMES = {
+    "list_cloudwatch_dashboards",
+    "get_dashboard_summary",
+    "list_log_groups",
+    "fetch_cloudwatch_logs_for_service",
+    "analyze_log_group",
+    "get_cloudwatch_alarms_for_service",
+    "setup_cross_account_access",
+}
 
 # Machine Learning Tools
-from .ml_tools import (
-    list_sagemaker_training_jobs,
-    get_training_job_details,
-    list_sagemaker_endpoints,
-    get_endpoint_details,
-    analyze_bedrock_usage,
-    get_ml_cost_recommendations,
-    analyze_ml_data_storage,
-)
+_ML_NAMES = {
+    "list_sagemaker_training_jobs",
+    "get_training_job_details",
+    "list_sagemaker_endpoints",
+    "get_endpoint_details",
+    "analyze_bedrock_usage",
+    "get_ml_cost_recommendations",
+    "analyze_ml_data_storage",
+}
 
 
 __all__ = [
@@ -42,4 +42,23 @@ __all__ = [
     "analyze_bedrock_usage",
     "get_ml_cost_recommendations",
     "analyze_ml_data_storage",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Lazily import tool modules on first attribute access (PEP 562).
+
+    Callers that only use the CloudWatch tools never import the ML tools
+    module and vice versa. Resolved names are cached back into the module
+    globals so subsequent lookups are plain dict hits.
+    """
+    if name in _CW_NAMES:
+        from . import cloudwatch_tools as _module
+    elif name in _ML_NAMES:
+        from . import ml_tools as _module
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_module, name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,90 @@
+"""
+Tool Result Cache
+
+Provides a small TTL + LRU memoization decorator for tool functions so
+repeated invocations with identical arguments hit memory instead of AWS.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+def _is_error_result(value) -> bool:
+    """Detect the tools' error convention: a string starting with 'Error'."""
+    return isinstance(value, str) and value.startswith("Error")
+
+
+def ttl_cache(ttl_seconds: int = 60, maxsize: int = 256, skip_if=None):
+    """
+    Memoize a function's results with a per-entry TTL and LRU eviction.
+
+    Agent frameworks frequently re-invoke the same tool with identical
+    arguments within a single conversation turn; caching those results
+    avoids repeat boto3 round-trips and their API charges. Keys hash the
+    function name plus all positional and keyword arguments, so calls
+    with different account_id/role_name never collide.
+
+    Failure results are never stored: the tools report errors by
+    returning an "Error ..." string rather than raising, and replaying a
+    transient throttle or STS hiccup for the full TTL would defeat the
+    retry path. The next identical call re-invokes the function instead.
+
+    Args:
+        ttl_seconds: How long a cached result stays valid (default: 60)
+        maxsize: Maximum number of entries before LRU eviction (default: 256)
+        skip_if: Predicate deciding whether a result must not be cached
+            (default: the tools' "Error ..." string convention)
+
+    Returns:
+        Decorator wrapping the function with the cache
+    """
+    if skip_if is None:
+        skip_if = _is_error_result
+
+    def decorator(fn):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = hashlib.md5(
+                json.dumps(
+                    (fn.__name__, args, kwargs), default=str, sort_keys=True
+                ).encode()
+            ).hexdigest()
+            now = time.monotonic()
+
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    created_at, value = entry
+                    if now - created_at < ttl_seconds:
+                        cache.move_to_end(key)
+                        logger.debug("Cache hit for %s", fn.__name__)
+                        return value
+                    del cache[key]
+
+            value = fn(*args, **kwargs)
+
+            if skip_if(value):
+                logger.debug("Not caching failure result from %s", fn.__name__)
+                return value
+
+            with lock:
+                cache[key] = (now, value)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+            return value
+
+        return wrapper
+
+    return decorator
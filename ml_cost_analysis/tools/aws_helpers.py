@@ -4,13 +4,50 @@ AWS Helper Utilities
 Provides helper functions for AWS cross-account access and client management.
 """
 
+import functools
 import logging
-import boto3
+import os
+import threading
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+import boto3
+from botocore.config import Config
+
 logger = logging.getLogger(__name__)
 
 
+def _int_env(name: str, default: int) -> int:
+    """Read an integer env-var override, falling back to the default."""
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+# Shared client configuration: a generous keep-alive connection pool,
+# throttling-aware adaptive retries, and tight timeouts so a throttled or
+# unreachable endpoint bounds the worst case per tool call instead of
+# blocking for the botocore defaults. Each knob can be overridden via env.
+_CLIENT_CONFIG = Config(
+    connect_timeout=_int_env("ML_COST_CONNECT_TIMEOUT", 3),
+    read_timeout=_int_env("ML_COST_READ_TIMEOUT", 15),
+    max_pool_connections=_int_env("ML_COST_MAX_POOL_CONNECTIONS", 50),
+    tcp_keepalive=True,
+    retries={
+        "mode": "adaptive",
+        "max_attempts": _int_env("ML_COST_MAX_RETRY_ATTEMPTS", 5),
+    },
+)
+
+# Clients memoized by (service, account_id, role_name). Values are
+# (client, expiration) tuples; expiration is None for same-account clients
+# and the assumed-role credential expiry (minus a refresh margin) otherwise.
+_CLIENT_CACHE = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+_CREDENTIAL_REFRESH_MARGIN = timedelta(seconds=60)
+
+
 def _get_cross_account_client(
     service: str,
     account_id: Optional[str] = None,
@@ -19,6 +56,11 @@ def _get_cross_account_client(
     """
     Get AWS client with optional cross-account access.
 
+    Clients are cached per (service, account_id, role_name) so repeated
+    tool calls reuse the same botocore client and its underlying
+    connection pool. Assumed-role clients are rebuilt shortly before
+    their STS credentials expire.
+
     Args:
         service: AWS service name (e.g., 'cloudwatch', 'logs', 'sts')
         account_id: Target AWS account ID for cross-account access
@@ -34,12 +76,23 @@ def _get_cross_account_client(
         >>> client = _get_cross_account_client('cloudwatch', '123456789012', 'MonitoringRole')
         >>> dashboards = client.list_dashboards()
     """
+    key = (service, account_id, role_name)
+
+    with _CLIENT_CACHE_LOCK:
+        cached = _CLIENT_CACHE.get(key)
+        if cached is not None:
+            client, expiration = cached
+            if expiration is None or datetime.now(timezone.utc) < expiration:
+                return client
+            # Assumed-role credentials are about to expire; fall through
+            # and rebuild the client with fresh credentials
+
     try:
         if account_id and role_name:
             logger.info(
                 f"Setting up cross-account access for account {account_id} with role {role_name}"
             )
-            sts = boto3.client("sts")
+            sts = boto3.client("sts", config=_CLIENT_CONFIG)
             role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
 
             assumed_role = sts.assume_role(
@@ -48,26 +101,37 @@ def _get_cross_account_client(
             )
             credentials = assumed_role["Credentials"]
 
-            return boto3.client(
+            client = boto3.client(
                 service,
                 aws_access_key_id=credentials["AccessKeyId"],
                 aws_secret_access_key=credentials["SecretAccessKey"],
                 aws_session_token=credentials["SessionToken"],
+                config=_CLIENT_CONFIG,
             )
+            expiration = credentials["Expiration"] - _CREDENTIAL_REFRESH_MARGIN
+        else:
+            client = boto3.client(service, config=_CLIENT_CONFIG)
+            expiration = None
 
-        return boto3.client(service)
+        with _CLIENT_CACHE_LOCK:
+            _CLIENT_CACHE[key] = (client, expiration)
+        return client
 
     except Exception as e:
         logger.error(f"Error creating {service} client: {str(e)}")
         raise
 
 
+@functools.lru_cache(maxsize=128)
 def _format_account_context(
     account_id: Optional[str] = None,
 ) -> str:
     """
     Format account context for logging and user messages.
 
+    Cached: every tool call formats the same handful of account IDs, so
+    the string is built once per account rather than per invocation.
+
     Args:
         account_id: AWS account ID (None for current account)
 
@@ -11,6 +11,7 @@ from typing import Optional
 
 from langchain_core.tools import tool
 
+from ._cache import ttl_cache
 from .aws_helpers import _get_cross_account_client, _format_account_context
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,7 @@ SERVICE_LOG_GROUPS = {
 
 
 @tool
+@ttl_cache(ttl_seconds=300)
 def list_cloudwatch_dashboards(
     account_id: Optional[str] = None,
     role_name: Optional[str] = None,
@@ -75,6 +77,7 @@ def list_cloudwatch_dashboards(
 
 
 @tool
+@ttl_cache(ttl_seconds=300)
 def get_dashboard_summary(
     dashboard_name: str,
     account_id: Optional[str] = None,
@@ -117,6 +120,7 @@ def get_dashboard_summary(
 
 
 @tool
+@ttl_cache(ttl_seconds=300)
 def list_log_groups(
     account_id: Optional[str] = None,
     role_name: Optional[str] = None,
@@ -359,6 +363,7 @@ def analyze_log_group(
 
 
 @tool
+@ttl_cache(ttl_seconds=60)
 def get_cloudwatch_alarms_for_service(
     service_name: str,
     account_id: Optional[str] = None,
@@ -1,11 +1,15 @@
 import yaml
-import json
 import logging
-import boto3
-from boto3.session import Session
-from datetime import datetime
+import functools
 from pathlib import Path
-from typing import Union, Dict, Optional, Any, List, Tuple
+from typing import Union, Dict, Optional
+
+# Prefer the libyaml C loader when available -- it parses 5-10x faster
+# than the pure-Python SafeLoader and both are safe-load equivalents
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 # set a logger
 logger = logging.getLogger(__name__)
@@ -15,17 +19,34 @@ def load_config(config_file: Union[Path, str]) -> Optional[Dict]:
     """
     Load configuration from a local file.
 
+    Results are cached per resolved path and file mtime, so repeated
+    calls skip the disk read and YAML parse while edits to the file
+    invalidate the cache. Callers must not mutate the returned dict.
+
     :param config_file: Path to the local file
     :return: Dictionary with the loaded configuration
     """
+    path = Path(config_file)
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        mtime = 0.0
+    return _load_config_cached(str(path), mtime)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(config_file: str, mtime: float) -> Optional[Dict]:
+    """Read and parse the config file; cached by (path, mtime)."""
     try:
         config_data: Optional[Dict] = None
-        logger.info(f"Loading config from local file system: {config_file}")
+        logger.info("Loading config from local file system: %s", config_file)
         content = Path(config_file).read_text()
-        config_data = yaml.safe_load(content)
-        logger.info(f"Loaded config from local file system: {config_data}")
+        config_data = yaml.load(content, Loader=_YamlLoader)
+        # The full config can be multi-KB; only serialize it when debug
+        # logging is actually enabled
+        logger.debug("Loaded config from local file system: %s", config_data)
     except Exception as e:
-        logger.error(f"Error loading config from local file system: {e}")
+        logger.error("Error loading config from local file system: %s", e)
         config_data = None
     return config_data
 
@@ -36,32 +57,55 @@ def load_system_prompt(
     """
     Load the system prompt from a file path.
 
+    Results are cached per path and file mtime, so repeated calls skip
+    the disk read while edits to the file invalidate the cache.
+
     Args:
         prompt_path: Relative or absolute path to the system prompt file
 
     Returns:
         The system prompt as a string
     """
+    path = Path(prompt_path)
+    if path.exists():
+        return _load_prompt_cached(str(path), path.stat().st_mtime)
+    # If not found, try relative to package directory
+    return _load_packaged_prompt(prompt_path)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_prompt_cached(prompt_path: str, mtime: float) -> str:
+    """Read a system prompt from disk; cached by (path, mtime)."""
     try:
-        # First try absolute path or relative to current directory
-        if Path(prompt_path).exists():
-            with open(prompt_path, 'r') as f:
-                prompt_content = f.read()
-            logger.info(f"Successfully loaded system prompt from {prompt_path}")
-            return prompt_content
-
-        # If not found, try relative to package directory
-        import pkg_resources
-        package_prompt_path = pkg_resources.resource_filename(
-            "ml_cost_analysis", prompt_path
-        )
-        with open(package_prompt_path, 'r') as f:
+        with open(prompt_path, 'r') as f:
             prompt_content = f.read()
-        logger.info(f"Successfully loaded system prompt from package: {package_prompt_path}")
+        logger.info("Successfully loaded system prompt from %s", prompt_path)
+        return prompt_content
+    except FileNotFoundError:
+        logger.error("System prompt file not found at %s", prompt_path)
+        raise
+    except Exception as e:
+        logger.error("Error loading system prompt from %s: %s", prompt_path, str(e))
+        raise
+
+
+@functools.lru_cache(maxsize=32)
+def _load_packaged_prompt(prompt_path: str) -> str:
+    """Read a system prompt bundled with the package; cached per path.
+
+    Uses importlib.resources rather than the deprecated pkg_resources,
+    whose first import scans every installed distribution's metadata.
+    """
+    try:
+        from importlib.resources import files
+        prompt_content = (
+            files("ml_cost_analysis").joinpath(prompt_path).read_text(encoding="utf-8")
+        )
+        logger.info("Successfully loaded system prompt from package: %s", prompt_path)
         return prompt_content
     except FileNotFoundError:
-        logger.error(f"System prompt file not found at {prompt_path}")
+        logger.error("System prompt file not found at %s", prompt_path)
         raise
     except Exception as e:
-        logger.error(f"Error loading system prompt from {prompt_path}: {str(e)}")
+        logger.error("Error loading system prompt from %s: %s", prompt_path, str(e))
         raise